@@ -3,6 +3,7 @@ API routes for chess analysis endpoints.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 
 from app.models.chess import (
@@ -15,8 +16,8 @@ from app.models.chess import (
 from app.services.chess_service import chess_service
 from app.core.config import settings
 
-# Create router
-router = APIRouter(prefix="/api/v1", tags=["chess"])
+# Create router; orjson serializes responses much faster than stdlib json
+router = APIRouter(prefix="/api/v1", tags=["chess"], default_response_class=ORJSONResponse)
 
 
 @router.get("/", response_model=APIInfoResponse)
@@ -90,55 +91,18 @@ async def get_best_move(request: StateStringRequest):
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 
-# Legacy endpoints for backward compatibility
-@router.get("/legacy/", response_model=APIInfoResponse)
-async def legacy_root():
-    """Legacy root endpoint"""
-    return APIInfoResponse(
-        message=settings.app_name,
-        version=settings.app_version,
-        endpoints={
-            "/analyze": "POST - Complete board analysis with all moves",
-            "/best-move": "POST - Get best move only",
-            "/health": "GET - Health check"
-        }
+# Legacy paths for backward compatibility. The handler objects are shared
+# with the primary routes, so FastAPI builds each dependency graph and
+# OpenAPI schema once instead of duplicating them per path.
+for _legacy_path, _endpoint, _methods, _response_model in (
+    ("/legacy/", get_api_info, ["GET"], APIInfoResponse),
+    ("/legacy/health", health_check, ["GET"], HealthResponse),
+    ("/legacy/analyze", analyze_position, ["POST"], AnalysisResponse),
+    ("/legacy/best-move", get_best_move, ["POST"], BestMoveResponse),
+):
+    router.add_api_route(
+        _legacy_path,
+        _endpoint,
+        methods=_methods,
+        response_model=_response_model,
     )
-
-
-@router.get("/legacy/health", response_model=HealthResponse)
-async def legacy_health_check():
-    """Legacy health check endpoint"""
-    health_data = chess_service.health_check()
-    return HealthResponse(**health_data)
-
-
-@router.post("/legacy/analyze", response_model=AnalysisResponse)
-async def legacy_analyze_position(request: StateStringRequest):
-    """Legacy analyze endpoint"""
-    try:
-        return chess_service.analyze_position(
-            state_string=request.state_string,
-            time_limit=request.time_limit
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
-
-
-@router.post("/legacy/best-move", response_model=BestMoveResponse)
-async def legacy_get_best_move(request: StateStringRequest):
-    """Legacy best move endpoint"""
-    try:
-        return chess_service.get_best_move(
-            state_string=request.state_string,
-            time_limit=request.time_limit
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except RuntimeError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
@@ -3,7 +3,9 @@ Pydantic models for chess-related data structures.
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from app.utils.chess_utils import parse_state_string
 
 
 class MoveAnalysis(BaseModel):
@@ -21,22 +23,31 @@ class StateStringRequest(BaseModel):
     """Request model for state string analysis"""
     state_string: str = Field(..., description="Chess position in format 'turn::fen::arrows'")
     time_limit: Optional[float] = Field(1.0, ge=0.1, le=10.0, description="Analysis time in seconds")
-    
-    @validator('state_string')
-    def validate_state_string(cls, v):
-        """Validate state string format"""
-        if not v or not isinstance(v, str):
+
+    _turn: str = PrivateAttr("")
+    _fen: str = PrivateAttr("")
+    _arrows: str = PrivateAttr("")
+
+    @model_validator(mode="after")
+    def parse_state(self):
+        """Parse and validate the state string exactly once"""
+        if not self.state_string:
             raise ValueError("State string must be a non-empty string")
-        
-        parts = v.split("::")
-        if len(parts) < 2:
-            raise ValueError("State string must contain at least turn and FEN separated by ::")
-        
-        turn = parts[0].strip()
-        if turn not in ["white", "black"]:
-            raise ValueError("Turn must be 'white' or 'black'")
-        
-        return v
+
+        self._turn, self._fen, self._arrows = parse_state_string(self.state_string)
+        return self
+
+    @property
+    def turn(self) -> str:
+        return self._turn
+
+    @property
+    def fen(self) -> str:
+        return self._fen
+
+    @property
+    def arrows(self) -> str:
+        return self._arrows
 
 
 class AnalysisResponse(BaseModel):
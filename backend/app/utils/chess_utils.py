@@ -2,11 +2,15 @@
 Utility functions for chess-related operations.
 """
 
+import functools
 import os
 import shutil
 from typing import Tuple, Optional
 import chess
 
+# O(1) membership check for the turn field
+_TURNS = frozenset(("white", "black"))
+
 
 def parse_state_string(state_string: str) -> Tuple[str, str, str]:
     """
@@ -21,54 +25,89 @@ def parse_state_string(state_string: str) -> Tuple[str, str, str]:
     Raises:
         ValueError: If state string format is invalid
     """
-    parts = state_string.split("::")
-    if len(parts) < 2:
+    # Single pass over the string: two partitions instead of a full split
+    turn, sep, rest = state_string.partition("::")
+    if not sep:
         raise ValueError("State string must contain at least turn and FEN separated by ::")
-    
-    turn = parts[0].strip()
-    fen = parts[1].strip()
-    arrows = parts[2].strip() if len(parts) > 2 else ""
-    
+
+    fen, _, arrows = rest.partition("::")
+    turn = turn.strip()
+    fen = fen.strip()
+    arrows = arrows.strip()
+
     # Validate turn
-    if turn not in ["white", "black"]:
+    if turn not in _TURNS:
         raise ValueError("Turn must be 'white' or 'black'")
     
-    # Validate FEN by trying to create a board
-    try:
-        chess.Board(fen)
-    except ValueError as e:
-        raise ValueError(f"Invalid FEN: {e}")
-    
+    # Validate FEN (cached, so repeated positions skip the parse)
+    if not validate_fen(fen):
+        raise ValueError(f"Invalid FEN: {fen}")
+
     return turn, fen, arrows
 
 
+@functools.lru_cache(maxsize=1)
+def _resolve_stockfish_path(stockfish_paths: tuple) -> Optional[str]:
+    """Resolve the Stockfish executable, checking explicit paths then PATH"""
+    for path in stockfish_paths:
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+    return shutil.which("stockfish")
+
+
 def find_stockfish_path(stockfish_paths: list) -> Optional[str]:
     """
     Find Stockfish executable in the given paths.
-    
+
+    The resolved path is memoized, so engine re-initialization and health
+    checks skip the repeated filesystem stats and PATH walk.
+
     Args:
         stockfish_paths: List of paths to check
-        
+
     Returns:
         Path to Stockfish executable or None if not found
     """
-    for path in stockfish_paths:
-        if os.path.isfile(path) and os.access(path, os.X_OK):
-            return path
-        if "/" not in path and not path.startswith("."):
-            resolved = shutil.which(path)
-            if resolved:
-                return resolved
-    return None
+    return _resolve_stockfish_path(tuple(stockfish_paths))
+
+
+@functools.lru_cache(maxsize=256)
+def _board_cached(fen: str) -> chess.Board:
+    """Construct and cache an immutable template board for a FEN"""
+    return chess.Board(fen)
+
+
+def board_from_fen(fen: str) -> chess.Board:
+    """
+    Build a chess.Board from a FEN string.
+
+    Common positions (the start position, popular openings) are served
+    from a cached template via a cheap copy instead of re-running the
+    FEN parse.
+
+    Args:
+        fen: FEN string
+
+    Returns:
+        A mutable chess.Board for the position
+
+    Raises:
+        ValueError: If the FEN is invalid
+    """
+    return _board_cached(fen).copy(stack=False)
 
 
+@functools.lru_cache(maxsize=4096)
 def validate_fen(fen: str) -> bool:
     """
     Validate FEN string format.
-    
+
+    Results are cached by FEN string, so re-validating a position seen
+    before is a dict lookup instead of a full FEN parse.
+
     Args:
         fen: FEN string to validate
-        
+
     Returns:
         True if valid, False otherwise
     """
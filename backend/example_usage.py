@@ -4,14 +4,48 @@ Example usage of the Chess Analysis API.
 This shows how to integrate the API with your frontend application.
 """
 
+from collections import OrderedDict
+
 import requests
-import json
+from requests.adapters import HTTPAdapter
 
 class ChessAPIClient:
     """Client for the Chess Analysis API"""
     
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
+        # Keep-alive session: reuses TCP (and TLS) connections across
+        # calls instead of handshaking per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Position results are deterministic for a given state_string and
+        # time_limit, so repeated queries (takebacks, review scrubbing)
+        # skip the HTTP round-trip entirely
+        self._cache = OrderedDict()
+        self._cache_max_entries = 512
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self._session.close()
+    
+    def _cache_get(self, key):
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+    
+    def _cache_put(self, key, value):
+        self._cache[key] = value
+        if len(self._cache) > self._cache_max_entries:
+            self._cache.popitem(last=False)
     
     def analyze_position(self, state_string, time_limit=1.0):
         """
@@ -24,17 +58,69 @@ class ChessAPIClient:
         Returns:
             Dictionary with complete analysis
         """
+        key = ("analyze", state_string, time_limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         try:
-            response = requests.post(f"{self.base_url}/api/v1/analyze", json={
+            response = self._session.post(f"{self.base_url}/api/v1/analyze", json={
                 "state_string": state_string,
                 "time_limit": time_limit
             })
             response.raise_for_status()
-            return response.json()
+            result = response.json()
+            self._cache_put(key, result)
+            return result
         except requests.exceptions.RequestException as e:
             print(f"Error analyzing position: {e}")
             return None
     
+    def analyze_positions(self, state_strings, time_limit=1.0):
+        """
+        Analyze many positions in one batched request.
+        
+        Amortises HTTP overhead across the batch and lets the server
+        spread the work over its engine pool (requires the
+        /analyze/batch endpoint). Positions already in the local
+        cache are not re-sent.
+        
+        Args:
+            state_strings: List of positions in format "turn::fen::arrows"
+            time_limit: Analysis time in seconds per position
+            
+        Returns:
+            List of analysis dictionaries in input order (None on failure)
+        """
+        results = {}
+        missing = []
+        pending = set()
+        for state_string in state_strings:
+            if state_string in pending:
+                continue
+            cached = self._cache_get(("analyze", state_string, time_limit))
+            if cached is not None:
+                results[state_string] = cached
+            else:
+                missing.append(state_string)
+                pending.add(state_string)
+        
+        if missing:
+            try:
+                response = self._session.post(f"{self.base_url}/analyze/batch", json={
+                    "items": [
+                        {"state_string": state_string, "time_limit": time_limit}
+                        for state_string in missing
+                    ]
+                })
+                response.raise_for_status()
+                for state_string, result in zip(missing, response.json()["results"]):
+                    results[state_string] = result
+                    self._cache_put(("analyze", state_string, time_limit), result)
+            except requests.exceptions.RequestException as e:
+                print(f"Error analyzing batch: {e}")
+        
+        return [results.get(state_string) for state_string in state_strings]
+    
     def get_best_move(self, state_string, time_limit=1.0):
         """
         Get the best move for a chess position.
@@ -46,13 +132,19 @@ class ChessAPIClient:
         Returns:
             Dictionary with best move information
         """
+        key = ("best-move", state_string, time_limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         try:
-            response = requests.post(f"{self.base_url}/api/v1/best-move", json={
+            response = self._session.post(f"{self.base_url}/api/v1/best-move", json={
                 "state_string": state_string,
                 "time_limit": time_limit
             })
             response.raise_for_status()
-            return response.json()
+            result = response.json()
+            self._cache_put(key, result)
+            return result
         except requests.exceptions.RequestException as e:
             print(f"Error getting best move: {e}")
             return None
@@ -60,7 +152,7 @@ class ChessAPIClient:
     def health_check(self):
         """Check if the API is running"""
         try:
-            response = requests.get(f"{self.base_url}/api/v1/health")
+            response = self._session.get(f"{self.base_url}/api/v1/health")
             return response.status_code == 200
         except:
             return False
@@ -1,117 +1,467 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+import asyncio
+import logging
 import chess
 import chess.engine
+import chess.polyglot
 import os
+import queue
+import re
 import sys
+import time
+import threading
 from chess_scoring import ChessAnalyzer
+from app.utils.chess_utils import board_from_fen, find_stockfish_path
 
 app = FastAPI(
     title="Chess Analysis API",
     description="API for analyzing chess positions using Stockfish engine",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+logger = logging.getLogger("chess")
+
 # Global analyzer instance
 analyzer = None
 
+# Optional polyglot opening book: known book positions answer /best-move
+# with a hash lookup instead of a Stockfish search
+BOOK_PATH = os.environ.get("POLYGLOT_BOOK", "books/Perfect2023.bin")
+_book: Optional[chess.polyglot.MemoryMappedReader] = None
+
+# Engine pool: one Stockfish process per dedicated OS thread, all fed from
+# a shared job queue so concurrent requests scale with CPU count instead of
+# contending on a single engine. Dedicated threads (rather than the shared
+# anyio/asyncio threadpool) keep each engine's pipes and locks on one
+# thread for the life of the process.
+# Default pool size leaves one engine per SF_THREADS-wide search so the
+# pool cannot oversubscribe the host's cores
+_DEFAULT_POOL_SIZE = max(1, (os.cpu_count() or 1) // int(os.environ.get("SF_THREADS", 1)))
+# Capped at the shared engine pool's capacity (one engine per CPU):
+# asking for more worker analyzers than the pool can ever serve would
+# block startup forever waiting on an engine lease
+ENGINE_POOL_SIZE = min(
+    max(1, int(os.environ.get("ENGINE_POOL_SIZE", _DEFAULT_POOL_SIZE))),
+    os.cpu_count() or 1
+)
+engine_jobs: Optional[queue.Queue] = None
+_engine_threads: list = []
+_pool_analyzers: list = []
+
+def _resolve_future(future: asyncio.Future, result, exc) -> None:
+    """Complete a future from the event loop thread"""
+    if future.cancelled():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+def engine_thread_loop(jobs: queue.Queue, worker_analyzer: ChessAnalyzer, loop) -> None:
+    """Run engine jobs on one dedicated OS thread bound to one engine"""
+    while True:
+        item = jobs.get()
+        if item is None:
+            # Shutdown sentinel
+            jobs.task_done()
+            break
+        job, future = item
+        try:
+            result = job(worker_analyzer)
+            loop.call_soon_threadsafe(_resolve_future, future, result, None)
+        except Exception as e:
+            loop.call_soon_threadsafe(_resolve_future, future, None, e)
+        finally:
+            jobs.task_done()
+
+async def run_engine_job(job):
+    """Submit a blocking engine job to the pool and await its result"""
+    if engine_jobs is None:
+        # Pool not started (e.g. direct calls in tests); run inline
+        return job(get_analyzer())
+    future = asyncio.get_running_loop().create_future()
+    engine_jobs.put((job, future))
+    return await future
+
+# In-flight coalescer: concurrent requests for the same position + time
+# limit await a single engine job instead of queueing duplicate searches
+_inflight: Dict[tuple, asyncio.Future] = {}
+_inflight_lock = asyncio.Lock()
+
+async def run_cached_engine_job(key: tuple, job) -> Dict[str, Any]:
+    """Run an engine job with cache lookup and in-flight deduplication"""
+    cached = tt_get(key)
+    if cached is not None:
+        return cached
+
+    async with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            # Someone is already searching this position; wait for them
+            owner = False
+        else:
+            future = asyncio.get_running_loop().create_future()
+            # The owner re-raises the job's exception itself; without a
+            # waiter the future's copy would count as never retrieved and
+            # spam the log with a duplicate traceback at collection
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            _inflight[key] = future
+            owner = True
+
+    if not owner:
+        return await future
+
+    try:
+        result = await run_engine_job(job)
+        if "error" not in result:
+            tt_put(key, result)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        async with _inflight_lock:
+            _inflight.pop(key, None)
+
+# Transposition cache: repeated requests for the same position + time limit
+# skip Stockfish entirely. Keyed by (kind, zobrist hash, time limit) — the
+# zobrist hash canonicalizes FEN spelling differences (castling/en-passant
+# notation) — and evicted LRU-style once full.
+TT_MAX_SIZE = max(1024, int(os.environ.get("ANALYSIS_CACHE_MAX", 100_000)))
+_tt: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_tt_lock = threading.Lock()
+
+def tt_key(kind: str, board: chess.Board, time_limit: Optional[float],
+           depth_limit: Optional[int] = None) -> tuple:
+    """Build a transposition-cache key for a position and search budget"""
+    # Only None means "default"; a falsy 0 must not alias the 1.0 key
+    return (kind, chess.polyglot.zobrist_hash(board),
+            round(1.0 if time_limit is None else time_limit, 2), depth_limit)
+
+def tt_get(key: tuple) -> Optional[Dict[str, Any]]:
+    """Look up a cached result, refreshing its LRU position on hit"""
+    with _tt_lock:
+        if key in _tt:
+            _tt.move_to_end(key)
+            return _tt[key]
+    return None
+
+def tt_put(key: tuple, value: Dict[str, Any]) -> None:
+    """Store a result, evicting the least recently used entry when full"""
+    with _tt_lock:
+        _tt[key] = value
+        _tt.move_to_end(key)
+        while len(_tt) > TT_MAX_SIZE:
+            _tt.popitem(last=False)
+
 class StateStringRequest(BaseModel):
+    # Reject unknown fields up front; typos fail loudly instead of being
+    # silently dropped
+    model_config = ConfigDict(extra="forbid")
+
     state_string: str
-    time_limit: Optional[float] = 1.0
+    # Bounded like the platform model: a zero or huge budget is a client
+    # bug, not a search we want to run (or cache)
+    time_limit: Optional[float] = Field(1.0, ge=0.1, le=10.0)
+    # Fixed search depth: with the engines' persistent hash, repeat
+    # positions reach the target depth in milliseconds instead of always
+    # burning the full time_limit
+    depth_limit: Optional[int] = None
+    # When set, /analyze returns moves as parallel columns (moves_soa)
+    # instead of a list of per-move dicts
+    columnar: Optional[bool] = False
+
+# Column order for the structure-of-arrays move representation
+MOVE_FIELDS = (
+    "move",
+    "white_advantage",
+    "is_mate",
+    "mate_in",
+    "best_response",
+    "depth_reached",
+    "nodes_searched"
+)
+
+class BatchRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    items: List[StateStringRequest]
 
 class AnalysisResponse(BaseModel):
+    # Concrete field types keep pydantic's Rust core on its fast path
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     fen: str
     turn: str
     total_moves: int
-    moves: list
+    moves: List[Dict[str, Any]]
+    moves_soa: Optional[Dict[str, list]] = None
     best_move: Optional[str] = None
     advantage: Optional[float] = None
     is_mate: bool = False
     mate_in: Optional[int] = None
-    principal_variation: list = []
+    principal_variation: List[str] = []
 
 class BestMoveResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     best_move: str
     advantage: Optional[float] = None
     is_mate: bool = False
     mate_in: Optional[int] = None
     depth_reached: Optional[int] = None
     nodes_searched: Optional[int] = None
-    principal_variation: list = []
+    principal_variation: List[str] = []
+
+# O(1) membership check for the turn field
+_TURNS = frozenset(("white", "black"))
+
+# Cheap shape check that rejects obviously malformed FENs before the
+# full parser (and board cache) ever sees them
+_FEN_RE = re.compile(r"^[rnbqkpRNBQKP1-8/]+ [wb] [KQkqA-Ha-h-]+ [a-h1-8-]+ \d+ \d+$")
+
+def _strip_if_needed(s: str) -> str:
+    """Strip only when there is whitespace to remove; well-formed client
+    strings skip the allocation entirely"""
+    if not s or (not s[0].isspace() and not s[-1].isspace()):
+        return s
+    return s.strip()
 
 def parse_state_string(state_string: str) -> tuple:
     """
     Parse state string in format "turn::fen::arrows"
     Returns (turn, fen, arrows)
     """
-    parts = state_string.split("::")
-    if len(parts) < 2:
+    # Single pass over the string: two partitions instead of a full split
+    turn, sep, rest = state_string.partition("::")
+    if not sep:
         raise ValueError("State string must contain at least turn and FEN separated by ::")
-    
-    turn = parts[0].strip()
-    fen = parts[1].strip()
-    arrows = parts[2].strip() if len(parts) > 2 else ""
-    
+
+    fen, _, arrows = rest.partition("::")
+    turn = _strip_if_needed(turn)
+    fen = _strip_if_needed(fen)
+    arrows = _strip_if_needed(arrows)
+
     # Validate turn
-    if turn not in ["white", "black"]:
+    if turn not in _TURNS:
         raise ValueError("Turn must be 'white' or 'black'")
-    
+
+    if not _FEN_RE.match(fen):
+        raise ValueError(f"Invalid FEN: {fen}")
+
     return turn, fen, arrows
 
+def _parse_state_fast(s: str) -> tuple:
+    """
+    Parse "turn::fen[::arrows]" without touching the arrows segment.
+
+    No endpoint consumes the arrows, so the hot path skips stripping and
+    materializing that (often long) tail entirely.
+    Returns (turn, fen).
+    """
+    turn, sep, rest = s.partition("::")
+    if not sep:
+        raise ValueError("State string must contain at least turn and FEN separated by ::")
+
+    fen, _, _ = rest.partition("::")
+    turn = _strip_if_needed(turn)
+    fen = _strip_if_needed(fen)
+
+    if turn not in _TURNS:
+        raise ValueError("Turn must be 'white' or 'black'")
+
+    if not _FEN_RE.match(fen):
+        raise ValueError(f"Invalid FEN: {fen}")
+
+    return turn, fen
+
+def best_move_from_analysis(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Derive best-move data from a completed board analysis.
+    The per-move entries already carry the post-move evaluation, so picking
+    the best move does not need a second engine search.
+    """
+    moves = analysis_data.get("moves", [])
+    if not moves:
+        return {
+            "error": "Analysis failed",
+            "best_move": None,
+            "advantage": None,
+            "is_mate": False,
+            "mate_in": None
+        }
+
+    white_to_move = analysis_data.get("turn") == "white"
+
+    # Prefer the fastest forced mate for the side to move
+    best = None
+    for move_data in moves:
+        if move_data.get("is_mate") and move_data.get("mate_in") is not None:
+            mate_in = move_data["mate_in"]
+            if white_to_move and mate_in > 0:
+                if best is None or mate_in < best["mate_in"]:
+                    best = move_data
+            elif not white_to_move and mate_in < 0:
+                if best is None or mate_in > best["mate_in"]:
+                    best = move_data
+
+    # Otherwise take the move with the best advantage for the side to move
+    if best is None:
+        scored = [m for m in moves if m.get("white_advantage") is not None]
+        if scored:
+            if white_to_move:
+                best = max(scored, key=lambda m: m["white_advantage"])
+            else:
+                best = min(scored, key=lambda m: m["white_advantage"])
+        else:
+            best = moves[0]
+
+    principal_variation = [best["move"]]
+    if best.get("best_response"):
+        principal_variation.append(best["best_response"])
+
+    return {
+        "best_move": best["move"],
+        "advantage": best.get("white_advantage"),
+        "is_mate": best.get("is_mate", False),
+        "mate_in": best.get("mate_in"),
+        "depth_reached": best.get("depth_reached"),
+        "nodes_searched": best.get("nodes_searched"),
+        "principal_variation": principal_variation
+    }
+
+# Common locations to try before falling back to PATH
+STOCKFISH_PATHS = [
+    "./stockfish",
+    "/usr/local/bin/stockfish",
+    "/usr/bin/stockfish"
+]
+
+def create_analyzer():
+    """Create and start one analyzer on the resolved Stockfish path"""
+    # Resolution is memoized, so retries after a failed startup don't
+    # re-stat every candidate path per request
+    stockfish_path = find_stockfish_path(STOCKFISH_PATHS)
+
+    if stockfish_path is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Stockfish engine not found. Please install Stockfish and ensure it's in your PATH or current directory."
+        )
+
+    new_analyzer = ChessAnalyzer(
+        engine_path=stockfish_path,
+        default_time=1.0,
+        show_raw_score=False,
+        show_best_move=False,
+        show_variation=False,
+        show_depth=False,
+        show_nodes=False,
+        verbose=False
+    )
+    new_analyzer.start_engine()
+    return new_analyzer
+
+_analyzer_init_lock = threading.Lock()
+
 def get_analyzer():
     """Get or create the global analyzer instance"""
     global analyzer
     if analyzer is None:
-        # Try to find Stockfish in common locations
-        stockfish_paths = [
-            "./stockfish",
-            "/usr/local/bin/stockfish",
-            "/usr/bin/stockfish",
-            "stockfish"  # If it's in PATH
-        ]
-        
-        stockfish_path = None
-        for path in stockfish_paths:
-            if os.path.exists(path) or path == "stockfish":
-                stockfish_path = path
-                break
-        
-        if stockfish_path is None:
-            raise HTTPException(
-                status_code=500, 
-                detail="Stockfish engine not found. Please install Stockfish and ensure it's in your PATH or current directory."
-            )
-        
-        analyzer = ChessAnalyzer(
-            engine_path=stockfish_path,
-            default_time=1.0,
-            show_raw_score=False,
-            show_best_move=False,
-            show_variation=False,
-            show_depth=False,
-            show_nodes=False
-        )
-        analyzer.start_engine()
-    
+        # Engine spawn can race between concurrent cold requests; only
+        # one caller may initialize the global
+        with _analyzer_init_lock:
+            if analyzer is None:
+                analyzer = create_analyzer()
     return analyzer
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize the chess analyzer on startup"""
+    """Initialize the analyzer pool and engine workers on startup"""
+    global engine_jobs, _book
+
+    # Remaining blocking work (engine spawn, sync helpers) runs in the
+    # shared threadpool; give it enough slots that a burst of requests
+    # cannot jam Starlette's default 40-token limiter
+    from anyio import to_thread
+    to_thread.current_default_thread_limiter().total_tokens = int(
+        os.environ.get("THREADPOOL_TOKENS", 200)
+    )
+
+    if os.path.exists(BOOK_PATH):
+        try:
+            _book = chess.polyglot.open_reader(BOOK_PATH)
+            logger.info("Opening book loaded from %s", BOOK_PATH)
+        except Exception as e:
+            logger.warning("Failed to load opening book %s: %s", BOOK_PATH, e)
+
     try:
-        get_analyzer()
-        print("✅ Chess analyzer initialized successfully")
+        _pool_analyzers.append(await run_in_threadpool(get_analyzer))
+        for _ in range(ENGINE_POOL_SIZE - 1):
+            _pool_analyzers.append(await run_in_threadpool(create_analyzer))
+        logger.info("Chess analyzer pool initialized (%d engines)", len(_pool_analyzers))
     except Exception as e:
-        print(f"❌ Failed to initialize chess analyzer: {e}")
+        logger.error("Failed to initialize chess analyzer pool: %s", e)
+
+    if _pool_analyzers:
+        engine_jobs = queue.Queue()
+        loop = asyncio.get_running_loop()
+        for worker_index, pool_analyzer in enumerate(_pool_analyzers):
+            thread = threading.Thread(
+                target=engine_thread_loop,
+                args=(engine_jobs, pool_analyzer, loop),
+                name=f"engine-worker-{worker_index}",
+                daemon=True
+            )
+            thread.start()
+            _engine_threads.append(thread)
+
+        # Warm the cold path before serving: load the polyglot tables and
+        # run a real search on every engine so NNUE weights are resident
+        # and the hash table's pages are faulted in before traffic arrives
+        warmup_time = float(os.environ.get("WARMUP_TIME", 0.3))
+        warmup_start = time.perf_counter()
+        warmup_board = chess.Board()
+        chess.polyglot.zobrist_hash(warmup_board)
+        try:
+            await asyncio.gather(*[
+                run_engine_job(lambda a: a.get_best_move(warmup_board, warmup_time))
+                for _ in _pool_analyzers
+            ])
+            logger.info("Engine warmup finished in %.3fs", time.perf_counter() - warmup_start)
+        except Exception as e:
+            logger.warning("Engine warmup failed: %s", e)
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up the chess analyzer on shutdown"""
-    global analyzer
+    """Clean up the engine workers and analyzer pool on shutdown"""
+    global analyzer, engine_jobs, _book
+    if _book is not None:
+        _book.close()
+        _book = None
+    if engine_jobs is not None:
+        for _ in _engine_threads:
+            engine_jobs.put(None)
+        for thread in _engine_threads:
+            thread.join(timeout=5.0)
+        _engine_threads.clear()
+        engine_jobs = None
+    for pool_analyzer in _pool_analyzers:
+        if pool_analyzer is not analyzer:
+            pool_analyzer.quit_engine()
+    _pool_analyzers.clear()
     if analyzer:
         analyzer.quit_engine()
-        print("🔚 Chess analyzer closed")
+        analyzer = None
+        logger.info("Chess analyzer closed")
 
 @app.get("/")
 async def root():
@@ -126,16 +476,38 @@ async def root():
         }
     }
 
+# Liveness probes can be frequent; once the analyzer exists, answer with
+# a precomputed constant. The TTL cache only matters on the cold path,
+# where probe storms would otherwise retry engine spawn per hit.
+_HEALTH_OK = {"status": "healthy", "engine": "stockfish"}
+HEALTH_TTL = 1.0
+_last_health: tuple = (0.0, None)
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    if analyzer is not None:
+        return _HEALTH_OK
+
+    global _last_health
+    checked_at, status = _last_health
+    if status is not None and time.monotonic() - checked_at < HEALTH_TTL:
+        return status
+
     try:
-        analyzer = get_analyzer()
-        return {"status": "healthy", "engine": "stockfish"}
+        # Engine spawn on a cold start can block; keep it off the loop
+        await run_in_threadpool(get_analyzer)
+        status = {"status": "healthy", "engine": "stockfish"}
     except Exception as e:
-        return {"status": "unhealthy", "error": str(e)}
+        status = {"status": "unhealthy", "error": str(e)}
 
-@app.post("/analyze", response_model=AnalysisResponse)
+    _last_health = (time.monotonic(), status)
+    return status
+
+# response_model omitted on purpose: the handler returns a prebuilt
+# ORJSONResponse, skipping pydantic's validation/serialization pass
+# (AnalysisResponse above documents the payload shape)
+@app.post("/analyze")
 async def analyze_position(request: StateStringRequest):
     """
     Analyze a chess position and return all possible moves with their advantages.
@@ -147,42 +519,154 @@ async def analyze_position(request: StateStringRequest):
         AnalysisResponse with complete board analysis
     """
     try:
-        # Parse the state string
-        turn, fen, arrows = parse_state_string(request.state_string)
-        
-        # Create chess board from FEN
-        board = chess.Board(fen)
-        
-        # Get analyzer
-        analyzer = get_analyzer()
-        
-        # Get complete board analysis
-        analysis_data = analyzer.get_board_analysis(board, request.time_limit)
-        
-        # Get best move data
-        best_move_data = analyzer.get_best_move(board, request.time_limit)
-        
-        # Combine the results
-        response = AnalysisResponse(
-            fen=analysis_data["fen"],
-            turn=analysis_data["turn"],
-            total_moves=analysis_data["total_moves"],
-            moves=analysis_data["moves"],
-            best_move=best_move_data.get("best_move"),
-            advantage=best_move_data.get("advantage"),
-            is_mate=best_move_data.get("is_mate", False),
-            mate_in=best_move_data.get("mate_in"),
-            principal_variation=best_move_data.get("principal_variation", [])
-        )
-        
-        return response
-        
+        return ORJSONResponse(await _analyze_payload(request))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
-@app.post("/best-move", response_model=BestMoveResponse)
+async def _analyze_payload(request: StateStringRequest) -> Dict[str, Any]:
+    """Run the full-analysis pipeline for one request and build its payload"""
+    # Parse the state string (arrows are never used, so skip them)
+    turn, fen = _parse_state_fast(request.state_string)
+
+    # Create chess board from FEN (cached for common positions)
+    board = board_from_fen(fen)
+
+    # Get complete board analysis (cached and deduplicated per
+    # position + time limit)
+    analysis_data = await run_cached_engine_job(
+        tt_key("analysis", board, request.time_limit, request.depth_limit),
+        lambda a: a.get_board_analysis(board, request.time_limit, request.depth_limit)
+    )
+
+    # Derive the best move from the per-move analysis instead of
+    # paying for a second engine search
+    best_move_data = best_move_from_analysis(analysis_data)
+
+    # Columnar responses carry one list per field instead of a dict
+    # per move: far fewer Python objects for large move lists
+    if request.columnar:
+        moves = []
+        moves_soa = {
+            field: [move_data.get(field) for move_data in analysis_data["moves"]]
+            for field in MOVE_FIELDS
+        }
+    else:
+        moves = analysis_data["moves"]
+        moves_soa = None
+
+    # The analyzer output is trusted primitives; the dict goes straight
+    # to orjson instead of routing through a pydantic model
+    return {
+        "fen": analysis_data["fen"],
+        "turn": analysis_data["turn"],
+        "total_moves": analysis_data["total_moves"],
+        "moves": moves,
+        "moves_soa": moves_soa,
+        "best_move": best_move_data.get("best_move"),
+        "advantage": best_move_data.get("advantage"),
+        "is_mate": best_move_data.get("is_mate", False),
+        "mate_in": best_move_data.get("mate_in"),
+        "principal_variation": best_move_data.get("principal_variation", [])
+    }
+
+@app.post("/analyze/batch")
+async def analyze_batch(batch: BatchRequest):
+    """
+    Analyze a list of positions in one request.
+
+    Routing and validation are paid once for the whole batch, and
+    positions are processed in order so consecutive positions from the
+    same game hit the engines' still-warm hash and the analysis cache.
+    A bad item yields an error entry instead of failing the batch.
+    """
+    results = []
+    for item in batch.items:
+        try:
+            results.append(await _analyze_payload(item))
+        except ValueError as e:
+            results.append({"error": str(e)})
+        except Exception as e:
+            results.append({"error": f"Analysis failed: {str(e)}"})
+    return ORJSONResponse({"results": results})
+
+@app.get("/analyze/stream")
+async def analyze_stream(request: Request, state_string: str, time_limit: Optional[float] = 1.0,
+                         multipv: int = 1):
+    """
+    Stream incremental analysis of a position as Server-Sent Events.
+
+    Emits one event per engine info line as the search deepens, so clients
+    see depth-1 results within milliseconds instead of waiting out the
+    full time limit, and can cancel the search by disconnecting. With
+    multipv > 1 (capped at the legal-move count) each event carries its
+    line's rank, letting a UI refine a whole move list live.
+    """
+    try:
+        turn, fen = _parse_state_fast(state_string)
+        board = board_from_fen(fen)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    multipv = max(1, min(multipv, board.legal_moves.count() or 1))
+
+    loop = asyncio.get_running_loop()
+    info_queue: asyncio.Queue = asyncio.Queue()
+    stop_search = threading.Event()
+
+    def run_search(worker_analyzer):
+        """Feed engine info lines to the stream; runs on an engine worker"""
+        try:
+            limit = chess.engine.Limit(time=time_limit)
+            with worker_analyzer.engine.analysis(board, limit, multipv=multipv) as search:
+                for info in search:
+                    if stop_search.is_set():
+                        break
+                    loop.call_soon_threadsafe(info_queue.put_nowait, info)
+        finally:
+            loop.call_soon_threadsafe(info_queue.put_nowait, None)
+        return {}
+
+    async def event_stream():
+        job = asyncio.ensure_future(run_engine_job(run_search))
+        try:
+            while True:
+                try:
+                    info = await asyncio.wait_for(info_queue.get(), timeout=0.25)
+                except asyncio.TimeoutError:
+                    # No news from the engine; check for client cancellation
+                    if await request.is_disconnected():
+                        break
+                    continue
+                if info is None:
+                    break
+
+                pv = info.get("pv", [])
+                payload = {
+                    "depth": info.get("depth"),
+                    "nodes": info.get("nodes"),
+                    "multipv": info.get("multipv", 1),
+                    "move": pv[0].uci() if pv else None,
+                    "pv": [move.uci() for move in pv[:5]]
+                }
+                score = info.get("score")
+                if score is not None:
+                    if score.is_mate():
+                        payload["mate_in"] = score.white().mate()
+                    else:
+                        payload["white_advantage"] = score.white().score() / 100.0
+
+                yield f"data: {orjson.dumps(payload).decode()}\n\n"
+        finally:
+            # Stop the search early so the engine slot is freed
+            stop_search.set()
+            await job
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+# response_model omitted for the same reason as /analyze
+@app.post("/best-move")
 async def get_best_move(request: StateStringRequest):
     """
     Get the best move for a chess position.
@@ -194,32 +678,67 @@ async def get_best_move(request: StateStringRequest):
         BestMoveResponse with best move information
     """
     try:
-        # Parse the state string
-        turn, fen, arrows = parse_state_string(request.state_string)
-        
-        # Create chess board from FEN
-        board = chess.Board(fen)
-        
-        # Get analyzer
-        analyzer = get_analyzer()
-        
-        # Get best move data
-        best_move_data = analyzer.get_best_move(board, request.time_limit)
+        # Parse the state string (arrows are never used, so skip them)
+        turn, fen = _parse_state_fast(request.state_string)
         
+        # Create chess board from FEN (cached for common positions)
+        board = board_from_fen(fen)
+
+        # Book positions skip the engine: the best move is a hash lookup
+        if _book is not None:
+            try:
+                entry = _book.find(board)
+                return ORJSONResponse({
+                    "best_move": entry.move.uci(),
+                    "advantage": None,
+                    "is_mate": False,
+                    "mate_in": None,
+                    "depth_reached": None,
+                    "nodes_searched": None,
+                    "principal_variation": [entry.move.uci()]
+                })
+            except IndexError:
+                # Out of book; fall through to Stockfish
+                pass
+
+        # A cached full analysis of this position already ranks every
+        # move; derive the best move from it instead of searching again.
+        # If an /analyze search for the position is running right now,
+        # subscribe to it rather than starting a second search.
+        analysis_key = tt_key("analysis", board, request.time_limit, request.depth_limit)
+        analysis_hit = tt_get(analysis_key)
+        if analysis_hit is None:
+            async with _inflight_lock:
+                running = _inflight.get(analysis_key)
+            if running is not None:
+                analysis_hit = await asyncio.shield(running)
+        if analysis_hit is not None:
+            best_move_data = best_move_from_analysis(analysis_hit)
+        else:
+            # Get best move data (cached and deduplicated per position +
+            # time limit)
+            best_move_data = await run_cached_engine_job(
+                tt_key("best_move", board, request.time_limit, request.depth_limit),
+                lambda a: a.get_best_move(board, request.time_limit, request.depth_limit)
+            )
+
         if "error" in best_move_data:
             raise HTTPException(status_code=500, detail=best_move_data["error"])
+
+        # Surfaces when the engine's persistent hash shortcut the search
+        logger.debug("best-move depth=%s nodes=%s",
+                     best_move_data.get("depth_reached"),
+                     best_move_data.get("nodes_searched"))
         
-        response = BestMoveResponse(
-            best_move=best_move_data["best_move"],
-            advantage=best_move_data.get("advantage"),
-            is_mate=best_move_data.get("is_mate", False),
-            mate_in=best_move_data.get("mate_in"),
-            depth_reached=best_move_data.get("depth_reached"),
-            nodes_searched=best_move_data.get("nodes_searched"),
-            principal_variation=best_move_data.get("principal_variation", [])
-        )
-        
-        return response
+        return ORJSONResponse({
+            "best_move": best_move_data["best_move"],
+            "advantage": best_move_data.get("advantage"),
+            "is_mate": best_move_data.get("is_mate", False),
+            "mate_in": best_move_data.get("mate_in"),
+            "depth_reached": best_move_data.get("depth_reached"),
+            "nodes_searched": best_move_data.get("nodes_searched"),
+            "principal_variation": best_move_data.get("principal_variation", [])
+        })
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -228,4 +747,6 @@ async def get_best_move(request: StateStringRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools cut framework overhead on the HTTP path, which
+    # dominates latency when analysis time limits are small
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
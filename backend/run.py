@@ -27,14 +27,31 @@ def main():
     print("🔍 ReDoc Documentation: http://localhost:8000/redoc")
     print("=" * 40)
     
+    # APP_MODE=prod runs one worker per CPU with the fast event loop and
+    # HTTP parser; the default keeps dev auto-reload (which forces a
+    # single worker plus a file-watcher thread)
+    mode = os.environ.get("APP_MODE", "dev")
+    
     try:
-        uvicorn.run(
-            "app.main:app",
-            host="0.0.0.0",
-            port=8000,
-            reload=True,  # Enable auto-reload for development
-            log_level="info"
-        )
+        if mode == "prod":
+            uvicorn.run(
+                "app.main:app",
+                host="0.0.0.0",
+                port=8000,
+                workers=os.cpu_count() or 1,
+                reload=False,
+                log_level="warning",
+                loop="uvloop",
+                http="httptools"
+            )
+        else:
+            uvicorn.run(
+                "app.main:app",
+                host="0.0.0.0",
+                port=8000,
+                reload=True,  # Enable auto-reload for development
+                log_level="info"
+            )
     except KeyboardInterrupt:
         print("\n🔚 Server stopped by user")
     except Exception as e:
@@ -1,10 +1,172 @@
 import chess
 import chess.engine
+import chess.polyglot
+import orjson
+import atexit
+import collections
+import concurrent.futures
+import functools
+import queue
 import sys
 import os
-import json
+import operator
+import threading
 from typing import Optional, Dict, Any, List
 
+
+class _EnginePool:
+    """
+    Shared pool of long-lived Stockfish processes.
+
+    Engines are spawned lazily up to max_engines and leased/returned
+    instead of being started and killed per analyzer, which avoids
+    ~50-200 ms of process startup per use and preserves Stockfish's
+    internal hash table across analyses.
+    """
+
+    def __init__(self, max_engines: Optional[int] = None):
+        self._max_engines = max_engines or os.cpu_count() or 1
+        self._free = queue.Queue()
+        self._lock = threading.Lock()
+        self._spawned = 0
+        self._engines = []
+
+    def acquire(self, engine_path: str):
+        """Lease an engine, blocking at capacity until one is returned."""
+        engine = self.try_acquire(engine_path)
+        if engine is not None:
+            return engine
+        # At capacity: wait for an engine to be returned
+        return self._free.get()
+
+    def try_acquire(self, engine_path: str):
+        """Lease an engine without blocking; returns None at capacity."""
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_spawn = self._spawned < self._max_engines
+            if can_spawn:
+                self._spawned += 1
+
+        if not can_spawn:
+            return None
+
+        try:
+            engine = chess.engine.SimpleEngine.popen_uci(engine_path)
+            # Tunable per deployment: more threads speed up a single
+            # search, a bigger hash keeps more of the tree between calls
+            engine.configure({
+                "Threads": int(os.environ.get("SF_THREADS", 1)),
+                "Hash": int(os.environ.get("SF_HASH_MB", 256)),
+                "Ponder": False
+            })
+        except Exception:
+            with self._lock:
+                self._spawned -= 1
+            raise
+        with self._lock:
+            self._engines.append(engine)
+        return engine
+
+    def release(self, engine) -> None:
+        """Return a leased engine to the pool."""
+        self._free.put(engine)
+
+    def shutdown(self) -> None:
+        """Quit every pooled engine (interpreter exit)."""
+        with self._lock:
+            engines, self._engines = self._engines, []
+            self._spawned = 0
+        for engine in engines:
+            try:
+                engine.quit()
+            except Exception:
+                pass
+
+
+_pools: Dict[str, _EnginePool] = {}
+_pools_lock = threading.Lock()
+
+def _get_pool(engine_path: str) -> _EnginePool:
+    """Get or create the engine pool for an executable path."""
+    with _pools_lock:
+        pool = _pools.get(engine_path)
+        if pool is None:
+            pool = _EnginePool()
+            _pools[engine_path] = pool
+        return pool
+
+def _shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown()
+
+atexit.register(_shutdown_pools)
+
+
+def _score_fields(score: Optional[chess.engine.PovScore]) -> Dict[str, Any]:
+    """
+    Derive all score-dependent move_data fields from one PovScore look.
+
+    One branch on mate and one accessor call replaces the separate
+    white_advantage / is_mate / mate_in extractions the builders used to
+    repeat per move.
+    """
+    fields = {"white_advantage": None, "is_mate": False, "mate_in": None}
+    if score is None:
+        return fields
+    if score.is_mate():
+        fields["is_mate"] = True
+        fields["mate_in"] = score.white().mate()
+    else:
+        centipawns = score.white().score()
+        if centipawns is not None:
+            # Positive = white better, negative = black better
+            fields["white_advantage"] = centipawns / 100.0
+    return fields
+
+
+def _sort_key_for(move_data: Dict[str, Any]) -> float:
+    """
+    Precomputed white-perspective sort value for a move_data dict.
+
+    Finite centipawn scores sort naturally; mates map to +/-100000 offset
+    by distance so a faster mate always outranks a slower one (the old
+    -999 sentinel lost that ordering).
+    """
+    if move_data["is_mate"]:
+        mate_in = move_data["mate_in"] or 0
+        return 100000.0 - mate_in if mate_in > 0 else -100000.0 - mate_in
+    if move_data["white_advantage"] is not None:
+        return move_data["white_advantage"]
+    return -999.0
+
+
+@functools.lru_cache(maxsize=32)
+def _make_limit(depth: Optional[int], time: Optional[float]) -> chess.engine.Limit:
+    """
+    Build (and memoize) a search limit carrying both bounds.
+
+    Passing depth and time together gives depth-limited searches a
+    wall-clock safety net, and the cache avoids re-allocating a Limit
+    per legal move in the loop callers.
+    """
+    return chess.engine.Limit(depth=depth, time=time)
+
+
+def _centipawns(score: chess.engine.PovScore) -> Optional[int]:
+    """
+    Extract the white-relative centipawn value from a PovScore.
+
+    Returns None for mate scores; use score.white().mate() for those.
+    Direct attribute access replaces the old str()+regex parsing.
+    """
+    return score.white().score()
+
+
+
 class ChessAnalyzer:
     def __init__(self, engine_path: str = "./stockfish", 
                  default_depth: Optional[int] = None,
@@ -13,7 +175,8 @@ class ChessAnalyzer:
                  show_best_move: bool = True,
                  show_variation: bool = True,
                  show_depth: bool = True,
-                 show_nodes: bool = True):
+                 show_nodes: bool = True,
+                 verbose: bool = True):
         """
         Initialize the chess analyzer with Stockfish engine and analysis options.
         
@@ -26,9 +189,12 @@ class ChessAnalyzer:
             show_variation: Whether to show principal variation
             show_depth: Whether to show search depth reached
             show_nodes: Whether to show nodes searched
+            verbose: Whether to print progress/results (disable for API/library use)
         """
         self.engine_path = engine_path
         self.engine = None
+        # Serializes fallback child searches on this analyzer's own engine
+        self._engine_lock = threading.Lock()
         self.default_depth = default_depth
         self.default_time = default_time
         self.show_raw_score = show_raw_score
@@ -36,6 +202,12 @@ class ChessAnalyzer:
         self.show_variation = show_variation
         self.show_depth = show_depth
         self.show_nodes = show_nodes
+        self.verbose = verbose
+        # Transposition table: analyses keyed by position + search limits,
+        # evicted LRU-style once full. Transpositions and repeated API hits
+        # on the same FEN skip the engine entirely.
+        self._tt = collections.OrderedDict()
+        self._tt_max_entries = 200_000
         
     def __enter__(self):
         """Context manager entry."""
@@ -52,20 +224,21 @@ class ChessAnalyzer:
             if not os.path.exists(self.engine_path):
                 raise FileNotFoundError(f"Stockfish engine not found at {self.engine_path}")
             
-            self.engine = chess.engine.SimpleEngine.popen_uci(self.engine_path)
-            print(f"✅ Stockfish engine started successfully")
+            self.engine = _get_pool(self.engine_path).acquire(self.engine_path)
+            print(f"✅ Stockfish engine leased from pool")
         except Exception as e:
             print(f"❌ Error starting engine: {e}")
             sys.exit(1)
     
     def quit_engine(self) -> None:
-        """Safely quit the engine."""
+        """Return the leased engine to the shared pool."""
         if self.engine:
             try:
-                self.engine.quit()
-                print("🔚 Engine closed")
+                _get_pool(self.engine_path).release(self.engine)
+                print("🔚 Engine returned to pool")
             except Exception as e:
-                print(f"⚠️  Warning: Error closing engine: {e}")
+                print(f"⚠️  Warning: Error releasing engine: {e}")
+            self.engine = None
     
     def analyze_position(self, board: chess.Board, time_limit: Optional[float] = None, 
                         depth_limit: Optional[int] = None) -> Dict[str, Any]:
@@ -89,70 +262,73 @@ class ChessAnalyzer:
         if depth_limit is None:
             depth_limit = self.default_depth
         
-        # Set analysis limits
-        if depth_limit:
-            limit = chess.engine.Limit(depth=depth_limit)
-        else:
-            limit = chess.engine.Limit(time=time_limit)
+        # Set analysis limits (both bounds: depth target, time safety net)
+        limit = _make_limit(depth_limit, time_limit)
         
         try:
-            info = self.engine.analyse(board, limit)
-            return info
+            # Iterative deepening with an early exit: once a short forced
+            # mate is found, searching deeper cannot change the result
+            last_info = {}
+            with self.engine.analysis(board, limit) as search:
+                for info in search:
+                    if "score" in info:
+                        last_info = info
+                        relative = info["score"].relative
+                        if relative.is_mate() and abs(relative.mate()) <= 3:
+                            search.stop()
+                            break
+                    elif not last_info:
+                        last_info = info
+            return last_info
         except Exception as e:
             print(f"❌ Error during analysis: {e}")
             return {}
-    
-    def get_score_text(self, score: chess.engine.Score) -> str:
+
+    def _analyse_cached(self, board: chess.Board, time_limit: Optional[float] = None,
+                        depth_limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze a position, reusing cached results for transpositions.
+
+        The key combines the position's Zobrist hash (a single int, far
+        cheaper than a FEN string) with the search limits, so the same
+        position reached through a different move order (or requested
+        again by the API) is a dict lookup instead of a Stockfish search.
+        """
+        key = (chess.polyglot.zobrist_hash(board), depth_limit, time_limit)
+        cached = self._tt.get(key)
+        if cached is not None:
+            self._tt.move_to_end(key)
+            return cached
+
+        info = self.analyze_position(board, time_limit, depth_limit)
+        if info:
+            self._tt[key] = info
+            if len(self._tt) > self._tt_max_entries:
+                self._tt.popitem(last=False)
+        return info
+
+    def get_score_text(self, score: chess.engine.PovScore) -> str:
         """Convert score to human-readable text."""
-        if score.is_mate():
-            mate_moves = score.mate()
+        # Typed dispatch: accept a PovScore (the engine's usual type) or a
+        # bare white-relative Score without any attribute probing
+        pov = score.white() if isinstance(score, chess.engine.PovScore) else score
+        if pov.is_mate():
+            mate_moves = pov.mate()
             if mate_moves > 0:
                 return f"White mates in {mate_moves} moves"
             else:
                 return f"Black mates in {abs(mate_moves)} moves"
+
+        centipawns = pov.score()
+        if centipawns is None:
+            return f"Score: {score} (raw)"
+
+        if centipawns > 0:
+            return f"White advantage: {centipawns/100:.2f} pawns"
+        elif centipawns < 0:
+            return f"Black advantage: {abs(centipawns)/100:.2f} pawns"
         else:
-            # Handle PovScore object - try different ways to get the score
-            centipawns = None
-            
-            # Try different methods to extract the score
-            if hasattr(score, 'relative'):
-                try:
-                    centipawns = int(score.relative)
-                except (TypeError, ValueError):
-                    pass
-            
-            if centipawns is None and hasattr(score, 'white'):
-                try:
-                    centipawns = int(score.white)
-                except (TypeError, ValueError):
-                    pass
-            
-            if centipawns is None and hasattr(score, 'score'):
-                try:
-                    centipawns = int(score.score)
-                except (TypeError, ValueError):
-                    pass
-            
-            if centipawns is None:
-                # Try to parse from string representation
-                score_str = str(score)
-                if "Cp(" in score_str:
-                    # Extract number from "Cp(+27)" format
-                    import re
-                    match = re.search(r'Cp\(([+-]?\d+)\)', score_str)
-                    if match:
-                        centipawns = int(match.group(1))
-                    else:
-                        return f"Score: {score} (raw)"
-                else:
-                    return f"Score: {score} (raw)"
-            
-            if centipawns > 0:
-                return f"White advantage: {centipawns/100:.2f} pawns"
-            elif centipawns < 0:
-                return f"Black advantage: {abs(centipawns)/100:.2f} pawns"
-            else:
-                return "Equal position"
+            return "Equal position"
     
     def analyze_fen(self, fen: str, time_limit: float = 1.0) -> None:
         """Analyze a position from FEN notation."""
@@ -164,124 +340,351 @@ class ChessAnalyzer:
     
     def analyze_board(self, board: chess.Board, time_limit: Optional[float] = None) -> None:
         """Analyze a chess board position."""
-        print(f"\n🔍 Analyzing position...")
-        print(f"📋 FEN: {board.fen()}")
-        
         # Use default time if not specified
         if time_limit is None:
             time_limit = self.default_time
         
+        info = self._analyse_cached(board, time_limit)
+        
+        if not self.verbose:
+            return
+        
+        # Batch output into one write instead of a print per line
+        lines = ["\n🔍 Analyzing position...", f"📋 FEN: {board.fen()}"]
         if self.default_depth:
-            print(f"🔬 Depth limit: {self.default_depth}")
+            lines.append(f"🔬 Depth limit: {self.default_depth}")
         else:
-            print(f"⏱️  Time limit: {time_limit}s")
-        
-        info = self.analyze_position(board, time_limit)
+            lines.append(f"⏱️  Time limit: {time_limit}s")
         
         if not info:
-            print("❌ Analysis failed")
+            lines.append("❌ Analysis failed")
+            print("\n".join(lines))
             return
         
         # Display results
         score = info.get("score")
         if score:
-            print(f"📊 Score: {self.get_score_text(score)}")
+            lines.append(f"📊 Score: {self.get_score_text(score)}")
             # Show raw centipawn value for reference
             if self.show_raw_score and not score.is_mate():
-                try:
-                    score_str = str(score)
-                    if "Cp(" in score_str:
-                        import re
-                        match = re.search(r'Cp\(([+-]?\d+)\)', score_str)
-                        if match:
-                            centipawns = int(match.group(1))
-                            print(f"🔢 Raw centipawns: {centipawns}")
-                except:
-                    pass
+                centipawns = _centipawns(score)
+                if centipawns is not None:
+                    lines.append(f"🔢 Raw centipawns: {centipawns}")
         
         # Show best move if available
         if self.show_best_move:
             pv = info.get("pv")
             if pv and len(pv) > 0:
-                print(f"🎯 Best move: {pv[0]}")
+                lines.append(f"🎯 Best move: {pv[0]}")
                 if self.show_variation and len(pv) > 1:
-                    print(f"📈 Principal variation: {' '.join(str(move) for move in pv[:5])}")
+                    lines.append(f"📈 Principal variation: {' '.join(move.uci() for move in pv[:5])}")
         
         # Show depth reached
         if self.show_depth:
             depth = info.get("depth")
             if depth:
-                print(f"🔬 Depth: {depth}")
+                lines.append(f"🔬 Depth: {depth}")
         
         # Show nodes searched
         if self.show_nodes:
             nodes = info.get("nodes")
             if nodes:
-                print(f"🧠 Nodes searched: {nodes:,}")
+                lines.append(f"🧠 Nodes searched: {nodes:,}")
+        
+        print("\n".join(lines))
     
+    @staticmethod
+    def _move_score_text(move_data: Dict[str, Any]) -> str:
+        """Human-readable score line for a parsed move_data dict."""
+        if move_data["is_mate"]:
+            mate_in = move_data["mate_in"]
+            if mate_in is not None and mate_in < 0:
+                return f"Black mates in {abs(mate_in)} moves"
+            return f"White mates in {mate_in} moves"
+
+        advantage = move_data["white_advantage"]
+        if advantage is None:
+            return "Score unavailable"
+        if advantage > 0:
+            return f"White advantage: {advantage:.2f} pawns"
+        if advantage < 0:
+            return f"Black advantage: {abs(advantage):.2f} pawns"
+        return "Equal position"
+
+    def _analyse_child(self, move: chess.Move, child_board: chess.Board,
+                       limit: chess.engine.Limit) -> Dict[str, Any]:
+        """Analyse one child position, preferring a free pooled engine."""
+        # Never block on a pool lease: when every engine is already held
+        # (e.g. one analyzer per core), waiting would deadlock because the
+        # holders only release at shutdown. Fall back to this analyzer's
+        # own engine instead, serialized so concurrent child searches
+        # cannot interleave commands on it.
+        pool = _get_pool(self.engine_path)
+        engine = pool.try_acquire(self.engine_path)
+        if engine is not None:
+            try:
+                info = engine.analyse(child_board, limit)
+            finally:
+                pool.release(engine)
+        else:
+            with self._engine_lock:
+                info = self.engine.analyse(child_board, limit)
+
+        pv = info.get("pv") or []
+        move_data = {
+            "move": move.uci(),
+            "best_response": pv[0].uci() if pv else None,
+            "depth_reached": info.get("depth"),
+            "nodes_searched": info.get("nodes")
+        }
+        move_data.update(_score_fields(info.get("score")))
+        move_data["sort_key"] = _sort_key_for(move_data)
+        return move_data
+
+    def _analyse_children_parallel(self, board: chess.Board,
+                                   limit: chess.engine.Limit) -> List[Dict[str, Any]]:
+        """
+        Score every legal move by searching each child position on its own
+        pooled engine in parallel.
+
+        Used for deep per-move searches where a single MultiPV root search
+        would dilute the fixed depth across lines; each child search is
+        independent, so this scales with physical cores.
+        """
+        if not board.legal_moves.count():
+            return []
+        legal_moves = list(board.legal_moves)
+
+        # Deduplicate children: distinct moves can transpose to the same
+        # position, and the cross-request TT may already hold the answer.
+        # Duplicates and cache hits never reach the engine.
+        children = []          # (index, move, child_board, tt_key)
+        first_seen = {}        # transposition key -> index of first child
+        duplicates = []        # (index, move, index of first child)
+        moves = [None] * len(legal_moves)
+        mover_is_white = board.turn
+        for i, move in enumerate(legal_moves):
+            child = board.copy(stack=False)
+            child.push(move)
+            # Trivially-known children skip the engine: delivered mate and
+            # dead draws need no search
+            if child.is_checkmate():
+                # Signed root-relative mate distance, matching the MultiPV
+                # path's score.white().mate() convention
+                move_data = {
+                    "move": move.uci(),
+                    "best_response": None,
+                    "depth_reached": None,
+                    "nodes_searched": None,
+                    "white_advantage": None,
+                    "is_mate": True,
+                    "mate_in": 1 if mover_is_white else -1
+                }
+                move_data["sort_key"] = _sort_key_for(move_data)
+                moves[i] = move_data
+                continue
+            if child.is_stalemate() or child.is_insufficient_material() or child.can_claim_draw():
+                moves[i] = {
+                    "move": move.uci(),
+                    "best_response": None,
+                    "depth_reached": None,
+                    "nodes_searched": None,
+                    "white_advantage": 0.0,
+                    "is_mate": False,
+                    "mate_in": None,
+                    "sort_key": 0.0
+                }
+                continue
+            pos_key = child._transposition_key()
+            if pos_key in first_seen:
+                duplicates.append((i, move, first_seen[pos_key]))
+                continue
+            first_seen[pos_key] = i
+            tt_key = ("child", pos_key, limit.depth, limit.time)
+            cached = self._tt.get(tt_key)
+            if cached is not None:
+                self._tt.move_to_end(tt_key)
+                moves[i] = dict(cached, move=str(move))
+                continue
+            children.append((i, move, child, tt_key))
+
+        if children:
+            workers = min(len(children), os.cpu_count() or 1)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._analyse_child, move, child, limit): (i, tt_key)
+                    for i, move, child, tt_key in children
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    i, tt_key = futures[future]
+                    move_data = future.result()
+                    moves[i] = move_data
+                    self._tt[tt_key] = move_data
+                    if len(self._tt) > self._tt_max_entries:
+                        self._tt.popitem(last=False)
+
+        # A duplicate child scores identically to its twin; only the move
+        # that reached it differs
+        for i, move, source in duplicates:
+            if moves[source] is not None:
+                moves[i] = dict(moves[source], move=str(move))
+
+        return [m for m in moves if m is not None]
+
+    def _analyse_root_cached(self, board: chess.Board, time_limit: Optional[float] = None,
+                             depth_limit: Optional[int] = None,
+                             multipv: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Score root moves, ranked best-first for the side to move.
+
+        One shared root search serves both the best-move and full-board
+        endpoints: results are cached per position and search limits
+        together with their MultiPV width, and a cached entry satisfies
+        any request of equal or narrower width. A best-move call right
+        after a board analysis of the same FEN is a dict lookup.
+        """
+        if not self.engine:
+            raise RuntimeError("Engine not started. Use start_engine() first.")
+
+        if time_limit is None:
+            time_limit = self.default_time
+        if depth_limit is None:
+            depth_limit = self.default_depth
+        if multipv is None:
+            multipv = board.legal_moves.count()
+        # Terminal positions (mate, stalemate, draws) have nothing to search
+        if not multipv or board.is_game_over():
+            return []
+
+        key = ("root", chess.polyglot.zobrist_hash(board), depth_limit, time_limit)
+        cached = self._tt.get(key)
+        if cached is not None and cached[0] >= multipv:
+            self._tt.move_to_end(key)
+            return cached[1][:multipv]
+
+        if depth_limit:
+            # Deep per-move search: MultiPV would dilute the fixed depth
+            # across lines, so search each child on its own pooled engine
+            limit = _make_limit(depth_limit, time_limit)
+            try:
+                moves = self._analyse_children_parallel(board, limit)
+            except Exception as e:
+                print(f"❌ Error during analysis: {e}")
+                return []
+            # White wants the key descending, black ascending
+            moves.sort(key=operator.itemgetter("sort_key"), reverse=board.turn)
+        else:
+            limit = _make_limit(None, time_limit)
+            try:
+                infos = self.engine.analyse(board, limit, multipv=multipv)
+            except Exception as e:
+                print(f"❌ Error during analysis: {e}")
+                return []
+
+            # MultiPV infos arrive already ranked for the side to move
+            moves = []
+            for info in infos:
+                pv = info.get("pv")
+                if not pv:
+                    continue
+
+                move_data = {
+                    "move": pv[0].uci(),
+                    "best_response": pv[1].uci() if len(pv) > 1 else None,
+                    "depth_reached": info.get("depth"),
+                    "nodes_searched": info.get("nodes")
+                }
+                move_data.update(_score_fields(info.get("score")))
+                move_data["sort_key"] = _sort_key_for(move_data)
+                moves.append(move_data)
+
+            # A full-width search should cover every legal move; if the
+            # engine returned fewer lines (very short limits), keep the
+            # remainder visible as unscored entries instead of dropping them
+            if multipv >= board.legal_moves.count() and len(moves) < multipv:
+                seen = {move_data["move"] for move_data in moves}
+                for move in board.legal_moves:
+                    uci = move.uci()
+                    if uci not in seen:
+                        moves.append({
+                            "move": uci,
+                            "best_response": None,
+                            "depth_reached": None,
+                            "nodes_searched": None,
+                            "white_advantage": None,
+                            "is_mate": False,
+                            "mate_in": None,
+                            "sort_key": -999.0
+                        })
+
+        if moves:
+            self._tt[key] = (multipv, moves)
+            if len(self._tt) > self._tt_max_entries:
+                self._tt.popitem(last=False)
+
+        return moves
+
+    def _analyse_root_multipv(self, board: chess.Board, time_limit: Optional[float] = None,
+                              depth_limit: Optional[int] = None,
+                              multipv: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Score root moves with a single MultiPV search.
+
+        One root search lets Stockfish share its internal transposition
+        table across all lines instead of paying N independent search
+        overheads for N legal moves.
+
+        Returns:
+            One move_data dict per principal variation, sorted by white
+            advantage (best first)
+        """
+        moves = self._analyse_root_cached(board, time_limit, depth_limit, multipv)
+        # Sort by the precomputed white-perspective key; strip it from the
+        # returned copies so it stays out of API payloads (and callers
+        # cannot mutate the cached dicts)
+        ranked = sorted(moves, key=operator.itemgetter("sort_key"), reverse=True)
+        return [{k: v for k, v in m.items() if k != "sort_key"} for m in ranked]
+
     def analyze_all_moves(self, board: chess.Board, time_limit: Optional[float] = None) -> None:
         """
         Analyze all possible legal moves and show the advantage after each move.
         
         Args:
             board: The chess position to analyze
-            time_limit: Time limit for each move analysis
+            time_limit: Time limit for the analysis
         """
-        print(f"\n🔍 Analyzing all possible moves...")
-        print(f"📋 FEN: {board.fen()}")
-        
-        if time_limit is None:
-            time_limit = self.default_time
-        
-        legal_moves = list(board.legal_moves)
-        print(f"📊 Total legal moves: {len(legal_moves)}")
-        
-        if not legal_moves:
-            print("❌ No legal moves available")
+        total_moves = board.legal_moves.count()
+        if self.verbose:
+            print(f"\n🔍 Analyzing all possible moves...")
+            print(f"📋 FEN: {board.fen()}")
+            print(f"📊 Total legal moves: {total_moves}")
+
+        if not total_moves:
+            if self.verbose:
+                print("❌ No legal moves available")
             return
-        
-        move_scores = []
-        
-        for i, move in enumerate(legal_moves, 1):
-            # Make the move
-            board.push(move)
-            
-            # Analyze the resulting position
-            info = self.analyze_position(board, time_limit)
-            
-            if info and "score" in info:
-                score = info["score"]
-                score_text = self.get_score_text(score)
-                
-                # Extract centipawn value for sorting
-                centipawns = 0
-                if not score.is_mate():
-                    try:
-                        score_str = str(score)
-                        if "Cp(" in score_str:
-                            import re
-                            match = re.search(r'Cp\(([+-]?\d+)\)', score_str)
-                            if match:
-                                centipawns = int(match.group(1))
-                    except:
-                        pass
-                
-                move_scores.append((move, score_text, centipawns, info))
-                print(f"  {i:2d}. {move}: {score_text}")
-            else:
-                print(f"  {i:2d}. {move}: Analysis failed")
-            
-            # Undo the move
-            board.pop()
-        
-        # Sort moves by score (best first)
-        move_scores.sort(key=lambda x: x[2], reverse=True)
-        
-        print(f"\n🏆 Top 5 moves by advantage:")
-        for i, (move, score_text, centipawns, info) in enumerate(move_scores[:5], 1):
-            print(f"  {i}. {move}: {score_text}")
-            if self.show_best_move and "pv" in info and info["pv"]:
-                print(f"     Best response: {info['pv'][0]}")
+
+        moves = self._analyse_root_multipv(board, time_limit, multipv=total_moves)
+
+        if not moves:
+            if self.verbose:
+                print("❌ Analysis failed")
+            return
+
+        if not self.verbose:
+            return
+
+        # One buffered write instead of a stdout syscall per move
+        lines = [
+            f"  {i:2d}. {move_data['move']}: {self._move_score_text(move_data)}"
+            for i, move_data in enumerate(moves, 1)
+        ]
+        lines.append(f"\n🏆 Top 5 moves by advantage:")
+        for i, move_data in enumerate(moves[:5], 1):
+            lines.append(f"  {i}. {move_data['move']}: {self._move_score_text(move_data)}")
+            if self.show_best_move and move_data["best_response"]:
+                lines.append(f"     Best response: {move_data['best_response']}")
+        print("\n".join(lines))
     
     def get_moves_json(self, board: chess.Board, time_limit: Optional[float] = None) -> Dict[str, Any]:
         """
@@ -289,179 +692,95 @@ class ChessAnalyzer:
         
         Args:
             board: The chess position to analyze
-            time_limit: Time limit for each move analysis
+            time_limit: Time limit for the analysis
             
         Returns:
             Dictionary with move analysis data
         """
-        if time_limit is None:
-            time_limit = self.default_time
-        
-        legal_moves = list(board.legal_moves)
+        total_moves = board.legal_moves.count()
         moves_data = {
             "fen": board.fen(),
-            "total_moves": len(legal_moves),
+            "total_moves": total_moves,
             "moves": []
         }
-        
-        if not legal_moves:
+
+        if not total_moves:
             return moves_data
-        
-        for move in legal_moves:
-            # Make the move
-            board.push(move)
-            
-            # Analyze the resulting position
-            info = self.analyze_position(board, time_limit)
-            
-            move_data = {
-                "move": str(move),
-                "white_advantage": None,
-                "is_mate": False,
-                "mate_in": None,
-                "best_response": None
-            }
-            
-            if info and "score" in info:
-                score = info["score"]
-                
-                if score.is_mate():
-                    mate_moves = score.mate()
-                    move_data["is_mate"] = True
-                    move_data["mate_in"] = mate_moves
-                    # For mate, we can't really say "white advantage" in centipawns
-                    move_data["white_advantage"] = None
-                else:
-                    # Extract centipawn value (always from white's perspective)
-                    try:
-                        score_str = str(score)
-                        if "Cp(" in score_str:
-                            import re
-                            match = re.search(r'Cp\(([+-]?\d+)\)', score_str)
-                            if match:
-                                centipawns = int(match.group(1))
-                                # Convert to white advantage (positive = white better, negative = black better)
-                                move_data["white_advantage"] = centipawns / 100.0  # Convert to pawns
-                    except:
-                        pass
-                
-                # Add best response if available
-                if "pv" in info and info["pv"]:
-                    move_data["best_response"] = str(info["pv"][0])
-            
-            # Undo the move
-            board.pop()
-            
-            moves_data["moves"].append(move_data)
-        
-        # Sort moves by white advantage (best first)
-        moves_data["moves"].sort(key=lambda x: x["white_advantage"] if x["white_advantage"] is not None else -999, reverse=True)
-        
+
+        # Keep this payload's original shape: no depth/nodes fields
+        for move_data in self._analyse_root_multipv(board, time_limit, multipv=total_moves):
+            moves_data["moves"].append({
+                "move": move_data["move"],
+                "white_advantage": move_data["white_advantage"],
+                "is_mate": move_data["is_mate"],
+                "mate_in": move_data["mate_in"],
+                "best_response": move_data["best_response"]
+            })
+
         return moves_data
-        
-    def get_board_analysis(self, board: chess.Board, time_limit: Optional[float] = None) -> Dict[str, Any]:
+    
+    def get_moves_json_bytes(self, board: chess.Board, time_limit: Optional[float] = None) -> bytes:
+        """
+        Get the move analysis pre-serialised as JSON bytes.
+
+        Lets an API hand the payload straight to the response instead of
+        re-encoding the dict from get_moves_json.
+
+        Args:
+            board: The chess position to analyze
+            time_limit: Time limit for the analysis
+
+        Returns:
+            UTF-8 JSON bytes of the move analysis data
+        """
+        return orjson.dumps(self.get_moves_json(board, time_limit))
+
+    def get_board_analysis(self, board: chess.Board, time_limit: Optional[float] = None,
+                           depth_limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Get complete board analysis with all moves and their advantages.
         
         Args:
             board: The chess position to analyze
-            time_limit: Time limit for each move analysis
+            time_limit: Time limit for the analysis
+            depth_limit: Optional fixed search depth (time_limit still caps wall time)
             
         Returns:
             Dictionary with complete board analysis
         """
-        if time_limit is None:
-            time_limit = self.default_time
-        
-        legal_moves = list(board.legal_moves)
+        total_moves = board.legal_moves.count()
         analysis_data = {
             "fen": board.fen(),
             "turn": "white" if board.turn else "black",
-            "total_moves": len(legal_moves),
+            "total_moves": total_moves,
             "moves": []
         }
-        
-        if not legal_moves:
+
+        if not total_moves:
             return analysis_data
-        
-        for move in legal_moves:
-            # Make the move
-            board.push(move)
-            
-            # Analyze the resulting position
-            info = self.analyze_position(board, time_limit)
-            
-            move_data = {
-                "move": str(move),
-                "white_advantage": None,
-                "is_mate": False,
-                "mate_in": None,
-                "best_response": None,
-                "depth_reached": None,
-                "nodes_searched": None
-            }
-            
-            if info and "score" in info:
-                score = info["score"]
-                
-                if score.is_mate():
-                    mate_moves = score.mate()
-                    move_data["is_mate"] = True
-                    move_data["mate_in"] = mate_moves
-                    # For mate, we can't really say "white advantage" in centipawns
-                    move_data["white_advantage"] = None
-                else:
-                    # Extract centipawn value (always from white's perspective)
-                    try:
-                        score_str = str(score)
-                        if "Cp(" in score_str:
-                            import re
-                            match = re.search(r'Cp\(([+-]?\d+)\)', score_str)
-                            if match:
-                                centipawns = int(match.group(1))
-                                # Convert to white advantage (positive = white better, negative = black better)
-                                move_data["white_advantage"] = centipawns / 100.0  # Convert to pawns
-                    except:
-                        pass
-                
-                # Add best response if available
-                if "pv" in info and info["pv"]:
-                    move_data["best_response"] = str(info["pv"][0])
-                
-                # Add depth and nodes info
-                if "depth" in info:
-                    move_data["depth_reached"] = info["depth"]
-                if "nodes" in info:
-                    move_data["nodes_searched"] = info["nodes"]
-            
-            # Undo the move
-            board.pop()
-            
-            analysis_data["moves"].append(move_data)
-        
-        # Sort moves by white advantage (best first)
-        analysis_data["moves"].sort(key=lambda x: x["white_advantage"] if x["white_advantage"] is not None else -999, reverse=True)
-        
+
+        analysis_data["moves"] = self._analyse_root_multipv(board, time_limit, depth_limit, multipv=total_moves)
+
         return analysis_data
         
-    def get_best_move(self, board: chess.Board, time_limit: Optional[float] = None) -> Dict[str, Any]:
+    def get_best_move(self, board: chess.Board, time_limit: Optional[float] = None,
+                      depth_limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Get the best move and advantage for the current position.
         
         Args:
             board: The chess position to analyze
             time_limit: Time limit for analysis
+            depth_limit: Optional fixed search depth (time_limit still caps wall time)
             
         Returns:
             Dictionary with best move information
         """
-        if time_limit is None:
-            time_limit = self.default_time
-        
-        # Analyze the current position
-        info = self.analyze_position(board, time_limit)
-        
-        if not info:
+        # Shares the cached root search with get_board_analysis: a wider
+        # cached analysis of the same position satisfies this multipv=1 ask
+        moves = self._analyse_root_cached(board, time_limit, depth_limit, multipv=1)
+
+        if not moves:
             return {
                 "error": "Analysis failed",
                 "best_move": None,
@@ -469,42 +788,22 @@ class ChessAnalyzer:
                 "is_mate": False,
                 "mate_in": None
             }
-        
-        score = info.get("score")
-        pv = info.get("pv", [])
-        
-        result = {
-            "best_move": str(pv[0]) if pv else None,
-            "advantage": None,
-            "is_mate": False,
-            "mate_in": None,
-            "depth_reached": info.get("depth"),
-            "nodes_searched": info.get("nodes"),
-            "principal_variation": [str(move) for move in pv[:5]] if pv else []
+
+        best = moves[0]
+        pv = [best["move"]]
+        if best["best_response"]:
+            pv.append(best["best_response"])
+
+        return {
+            "best_move": best["move"],
+            "advantage": best["white_advantage"],
+            "is_mate": best["is_mate"],
+            "mate_in": best["mate_in"],
+            "depth_reached": best["depth_reached"],
+            "nodes_searched": best["nodes_searched"],
+            "principal_variation": pv
         }
         
-        if score:
-            if score.is_mate():
-                mate_moves = score.mate()
-                result["is_mate"] = True
-                result["mate_in"] = mate_moves
-                result["advantage"] = None
-            else:
-                # Extract centipawn value
-                try:
-                    score_str = str(score)
-                    if "Cp(" in score_str:
-                        import re
-                        match = re.search(r'Cp\(([+-]?\d+)\)', score_str)
-                        if match:
-                            centipawns = int(match.group(1))
-                            # Convert to advantage (positive = white better, negative = black better)
-                            result["advantage"] = centipawns / 100.0  # Convert to pawns
-                except:
-                    pass
-        
-        return result
-        
     def save_moves_json(self, board: chess.Board, filename: str, time_limit: Optional[float] = None) -> None:
         """
         Save all possible moves with their white advantage scores to a JSON file.
@@ -516,8 +815,8 @@ class ChessAnalyzer:
         """
         moves_data = self.get_moves_json(board, time_limit)
         
-        with open(filename, 'w') as f:
-            json.dump(moves_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(moves_data, option=orjson.OPT_INDENT_2))
         
         print(f"💾 Saved move analysis to {filename}")
         print(f"📊 Analyzed {moves_data['total_moves']} moves")
@@ -531,32 +830,42 @@ class ChessAnalyzer:
             moves: List of moves to analyze
             time_limit: Time limit for each analysis
         """
-        print(f"\n🔍 Analyzing move sequence...")
-        print(f"📋 Starting FEN: {board.fen()}")
+        if self.verbose:
+            print(f"\n🔍 Analyzing move sequence...")
+            print(f"📋 Starting FEN: {board.fen()}")
         
         if time_limit is None:
             time_limit = self.default_time
         
-        current_board = board.copy()
-        
-        for i, move in enumerate(moves, 1):
-            if move not in current_board.legal_moves:
-                print(f"❌ Move {i}: {move} is not legal")
-                break
-            
-            # Make the move
-            current_board.push(move)
-            
-            # Analyze the position
-            info = self.analyze_position(current_board, time_limit)
-            
-            if info and "score" in info:
-                score = info["score"]
-                score_text = self.get_score_text(score)
-                print(f"  {i}. After {move}: {score_text}")
-            else:
-                print(f"  {i}. After {move}: Analysis failed")
-                break
+        # Push moves on the caller's board and unwind in finally: avoids
+        # copying the full move-history stack just to keep the board intact
+        pushed = 0
+        try:
+            for i, move in enumerate(moves, 1):
+                # is_legal checks the one move directly instead of
+                # generating and scanning the whole legal-move list
+                if not board.is_legal(move):
+                    if self.verbose:
+                        print(f"❌ Move {i}: {move} is not legal")
+                    break
+                
+                # Make the move
+                board.push(move)
+                pushed += 1
+                
+                # Analyze the position
+                info = self._analyse_cached(board, time_limit)
+                
+                if info and "score" in info:
+                    if self.verbose:
+                        print(f"  {i}. After {move}: {self.get_score_text(info['score'])}")
+                else:
+                    if self.verbose:
+                        print(f"  {i}. After {move}: Analysis failed")
+                    break
+        finally:
+            for _ in range(pushed):
+                board.pop()
 
 def main():
     """Main function to demonstrate the chess analyzer."""